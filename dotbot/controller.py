@@ -395,19 +395,21 @@ class Controller:
                 )
                 if new_position.x != 0xFFFFFFFF and new_position.y != 0xFFFFFFFF:
                     dotbot.lh2_position = new_position
+                    distance = (
+                        lh2_distance(dotbot.position_history[-1], new_position)
+                        if dotbot.position_history
+                        else None
+                    )
                     if (
-                        dotbot.position_history
-                        and lh2_distance(dotbot.position_history[-1], new_position)
-                        < LH2_POSITION_DISTANCE_THRESHOLD
+                        distance is not None
+                        and distance < LH2_POSITION_DISTANCE_THRESHOLD
                     ):
                         # If the new position is too close from the last one, we consider it as noise and we don't add it to the position history
                         logger.debug(
                             "Discarding LH2 position update because it's too close from the last one",
                             last_position=dotbot.position_history[-1].model_dump(),
                             new_position=new_position.model_dump(),
-                            distance=lh2_distance(
-                                dotbot.position_history[-1], new_position
-                            ),
+                            distance=distance,
                         )
                     else:
                         dotbot.position_history.append(new_position)
@@ -564,13 +566,10 @@ class Controller:
     async def notify_clients(self, notification):
         """Send a message to all clients connected."""
         self.logger.debug("notify", cmd=notification.cmd.name)
+        # Serialize once, the same text is sent to every client
+        message = json.dumps(notification.model_dump(exclude_none=True))
         await asyncio.gather(
-            *[
-                self._ws_send_safe(
-                    websocket, json.dumps(notification.model_dump(exclude_none=True))
-                )
-                for websocket in self.websockets
-            ]
+            *[self._ws_send_safe(websocket, message) for websocket in self.websockets]
         )
 
     def send_payload(self, destination: int, payload: Payload):
@@ -592,7 +591,14 @@ class Controller:
     def get_dotbots(self, query: DotBotQueryModel) -> List[DotBotModel]:
         """Returns the list of dotbots matching the query."""
         dotbots: List[DotBotModel] = []
-        for dotbot in self.dotbots.values():
+        max_positions = (
+            MAX_POSITION_HISTORY_SIZE
+            if query.max_positions is None
+            else query.max_positions
+        )
+        for dotbot in sorted(self.dotbots.values(), key=lambda bot: bot.address):
+            if query.limit is not None and len(dotbots) >= query.limit:
+                break
             if query.address is not None and dotbot.address != query.address:
                 continue
             if (
@@ -635,17 +641,13 @@ class Controller:
                 if query.min_position_y is not None:
                     if query.min_position_y > dotbot.lh2_position.y:
                         continue
-            _dotbot = DotBotModel(**dotbot.model_dump())
-            max_positions = (
-                MAX_POSITION_HISTORY_SIZE
-                if query.max_positions is None
-                else query.max_positions
+            # Shallow copy: fields are reassigned, never mutated in place,
+            # except the position history which gets its own sliced list.
+            dotbots.append(
+                dotbot.model_copy(
+                    update={"position_history": dotbot.position_history[:max_positions]}
+                )
             )
-            _dotbot.position_history = _dotbot.position_history[:max_positions]
-            dotbots.append(_dotbot)
-        dotbots = sorted(dotbots, key=lambda dotbot: dotbot.address)
-        if query.limit is not None:
-            dotbots = dotbots[: query.limit]
         return dotbots
 
     async def web(self):
@@ -3,11 +3,15 @@ import math
 import os
 from typing import Dict, List
 
+import numpy as np
+from scipy.spatial import cKDTree
+
 from dotbot.examples.common.orca import (
     Agent,
     OrcaParams,
     compute_orca_velocity_for_agent,
 )
+from dotbot.examples.common.queries import ACTIVE_DOTBOTS_QUERY
 from dotbot.examples.common.vec2 import Vec2
 from dotbot.models import (
     DotBotLH2Position,
@@ -15,7 +19,6 @@ from dotbot.models import (
     DotBotMoveRawCommandModel,
     DotBotQueryModel,
     DotBotRgbLedCommandModel,
-    DotBotStatus,
     DotBotWaypoints,
     WSRgbLed,
     WSWaypoints,
@@ -27,6 +30,11 @@ from dotbot.websocket import DotBotWsClient
 THRESHOLD = 100  # Acceptable distance error to consider a waypoint reached
 DT = 0.2  # Control loop period (seconds)
 
+BIAS_ANGLE = 0.0  # Right-hand rule bias applied to the angle to goal (radians)
+COS_BIAS = math.cos(BIAS_ANGLE)
+SIN_BIAS = math.sin(BIAS_ANGLE)
+THRESHOLD_SQ = THRESHOLD * THRESHOLD
+
 # TODO: Measure these values for real dotbots
 BOT_RADIUS = 60  # Physical radius of a DotBot (unit), used for collision avoidance
 MAX_SPEED = 300  # Maximum allowed linear speed of a bot (mm/s)
@@ -60,9 +68,7 @@ async def queue_robots(
 
 
 async def fetch_active_dotbots(client: RestClient) -> List[DotBotModel]:
-    return await client.fetch_dotbots(
-        query=DotBotQueryModel(status=DotBotStatus.ACTIVE)
-    )
+    return await client.fetch_dotbots(query=ACTIVE_DOTBOTS_QUERY)
 
 
 async def charge_robots(
@@ -81,7 +87,8 @@ async def charge_robots(
     while remaining or park_dotbot is not None:
         dotbots = await fetch_active_dotbots(client)
 
-        dotbots = [b for b in dotbots if b.address in {r.address for r in remaining}]
+        remaining_addresses = {r.address for r in remaining}
+        dotbots = [b for b in dotbots if b.address in remaining_addresses]
         remaining = order_bots(dotbots, QUEUE_HEAD_X, QUEUE_HEAD_Y)
 
         # Assign charging + shift goals
@@ -178,45 +185,75 @@ async def send_to_goal(
 ) -> None:
     while True:
         dotbots = await fetch_active_dotbots(client)
-        agents: List[Agent] = []
-
-        for bot in dotbots:
-            agents.append(
-                Agent(
-                    id=bot.address,
-                    position=Vec2(x=bot.lh2_position.x, y=bot.lh2_position.y),
-                    velocity=Vec2(x=0, y=0),
-                    radius=BOT_RADIUS,
-                    max_speed=MAX_SPEED,
-                    preferred_velocity=preferred_vel(
-                        dotbot=bot, goal=goals.get(bot.address)
-                    ),
-                )
-            )
+        if not dotbots:
+            break
 
-        queue_ready = all(
-            a.preferred_velocity.x == 0 and a.preferred_velocity.y == 0 for a in agents
+        positions = np.array(
+            [[bot.lh2_position.x, bot.lh2_position.y] for bot in dotbots],
+            dtype=float,
         )
+        goal_list = [goals.get(bot.address) for bot in dotbots]
+        targets = np.full_like(positions, np.nan)
+        for i, goal in enumerate(goal_list):
+            if goal is not None:
+                targets[i] = (goal["x"], goal["y"])
+        preferred = preferred_velocities(positions, targets)
+
+        queue_ready = not preferred.any()
         if queue_ready:
             break
-        for agent in agents:
-            neighbors = [neighbor for neighbor in agents if neighbor.id != agent.id]
 
-            orca_vel = await compute_orca_velocity(
-                agent, neighbors=neighbors, params=params
+        agents: List[Agent] = [
+            Agent(
+                id=bot.address,
+                position=Vec2(x=x, y=y),
+                velocity=Vec2(x=0, y=0),
+                radius=BOT_RADIUS,
+                max_speed=MAX_SPEED,
+                preferred_velocity=Vec2(x=vx, y=vy),
+            )
+            for bot, (x, y), (vx, vy) in zip(
+                dotbots, positions.tolist(), preferred.tolist()
+            )
+        ]
+
+        # Two bots closing in at MAX_SPEED each can only collide within the
+        # time horizon if they are closer than this; farther agents never
+        # constrain the ORCA solution.
+        orca_range = 2 * (BOT_RADIUS + MAX_SPEED * params.time_horizon)
+        tree = cKDTree(positions)
+
+        messages = []
+        for agent, goal in zip(agents, goal_list):
+            # Sorted so neighbors keep the snapshot order: the ORCA solve
+            # depends on the order of its constraint lines.
+            neighbor_indices = tree.query_ball_point(
+                [agent.position.x, agent.position.y],
+                r=orca_range,
+                return_sorted=True,
             )
+            neighbors = [
+                agents[idx] for idx in neighbor_indices if agents[idx].id != agent.id
+            ]
+
+            if not neighbors:
+                orca_vel = agent.preferred_velocity
+            else:
+                orca_vel = await compute_orca_velocity(
+                    agent, neighbors=neighbors, params=params
+                )
             step = Vec2(x=orca_vel.x, y=orca_vel.y)
 
             # ---- CLAMP STEP TO GOAL DISTANCE ----
-            goal = goals.get(agent.id)
             if goal is not None:
                 dx = goal["x"] - agent.position.x
                 dy = goal["y"] - agent.position.y
-                dist_to_goal = math.hypot(dx, dy)
+                dist_to_goal_sq = dx * dx + dy * dy
 
-                step_len = math.hypot(step.x, step.y)
-                if step_len > dist_to_goal and step_len > 0:
-                    scale = dist_to_goal / step_len
+                # Compare squared lengths; only take a root when clamping.
+                step_len_sq = step.x * step.x + step.y * step.y
+                if step_len_sq > dist_to_goal_sq:
+                    scale = math.sqrt(dist_to_goal_sq / step_len_sq)
                     step = Vec2(x=step.x * scale, y=step.y * scale)
             # ------------------------------------
 
@@ -228,7 +265,7 @@ async def send_to_goal(
                     )
                 ],
             )
-            await ws.send(
+            messages.append(
                 WSWaypoints(
                     cmd="waypoints",
                     address=agent.id,
@@ -236,6 +273,7 @@ async def send_to_goal(
                     data=waypoints,
                 )
             )
+        await ws.send_many(messages)
 
         await asyncio.sleep(DT)
     return None
@@ -293,41 +331,17 @@ def assign_charge_goals(
     return goals
 
 
-def preferred_vel(dotbot: DotBotModel, goal: Vec2 | None) -> Vec2:
-    if goal is None:
-        return Vec2(x=0, y=0)
-
-    dx = goal["x"] - dotbot.lh2_position.x
-    dy = goal["y"] - dotbot.lh2_position.y
-    dist = math.sqrt(dx * dx + dy * dy)
-
-    # If close to goal, stop
-    if dist < THRESHOLD:
-        return Vec2(x=0, y=0)
-
-    # Right-hand rule bias
-    bias_angle = 0.0
-    # Convert bot direction into radians
-    direction = direction_to_rad(dotbot.direction)
-
-    # Angle to goal
-    angle_to_goal = math.atan2(dy, dx) + bias_angle
-
-    delta = angle_to_goal - direction
-    # Wrap to [-π, +π]
-    delta = math.atan2(math.sin(delta), math.cos(delta))
-
-    # Final allowed direction
-    final_angle = direction + delta
-    result = Vec2(
-        x=math.cos(final_angle) * MAX_SPEED, y=math.sin(final_angle) * MAX_SPEED
-    )
-    return result
-
-
-def direction_to_rad(direction: float) -> float:
-    rad = (direction + 90) * math.pi / 180.0
-    return math.atan2(math.sin(rad), math.cos(rad))  # normalize to [-π, +π]
+def preferred_velocities(positions: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    delta = targets - positions
+    dist_sq = np.einsum("ij,ij->i", delta, delta)
+    # Bots without a goal have a NaN target, which compares False: they stay still
+    moving = dist_sq >= THRESHOLD_SQ
+    scale = np.zeros_like(dist_sq)
+    scale[moving] = MAX_SPEED / np.sqrt(dist_sq[moving])
+    velocity = np.where(moving[:, None], delta * scale[:, None], 0.0)
+    vx = velocity[:, 0] * COS_BIAS - velocity[:, 1] * SIN_BIAS
+    vy = velocity[:, 0] * SIN_BIAS + velocity[:, 1] * COS_BIAS
+    return np.column_stack((vx, vy))
 
 
 async def compute_orca_velocity(
@@ -350,8 +364,8 @@ async def main() -> None:
         await ws.connect()
         try:
             # Cosmetic: all bots are red
-            for dotbot in dotbots:
-                await ws.send(
+            await ws.send_many(
+                [
                     WSRgbLed(
                         cmd="rgb_led",
                         address=dotbot.address,
@@ -362,7 +376,9 @@ async def main() -> None:
                             blue=0,
                         ),
                     )
-                )
+                    for dotbot in dotbots
+                ]
+            )
 
             # Phase 1: initial queue
             await queue_robots(client, ws, dotbots, params)
@@ -371,8 +387,8 @@ async def main() -> None:
             await charge_robots(client, ws, params)
         except (asyncio.CancelledError, KeyboardInterrupt):
             active_dotbots = await fetch_active_dotbots(client)
-            for dotbot in active_dotbots:
-                await ws.send(
+            await ws.send_many(
+                [
                     WSWaypoints(
                         cmd="waypoints",
                         address=dotbot.address,
@@ -382,7 +398,9 @@ async def main() -> None:
                             waypoints=[],
                         ),
                     )
-                )
+                    for dotbot in active_dotbots
+                ]
+            )
         finally:
             await ws.close()
 
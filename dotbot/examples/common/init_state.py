@@ -0,0 +1,35 @@
+"""
+Helpers to write simulator initial-state TOML files.
+
+Used by the `gen_init_pose.py` scripts of the examples, which only differ in
+how they lay the DotBots out in the arena.
+"""
+
+from typing import Optional, TextIO
+
+
+def dotbot_address(index: int) -> str:
+    """Return the simulated DotBot address for a 1-based robot index."""
+    return f"AAAAAAAA{index:08X}"
+
+
+def write_dotbot_entry(
+    f: TextIO,
+    index: int,
+    pos_x: int,
+    pos_y: int,
+    direction: int,
+    control_loop_library_path: Optional[str] = None,
+) -> None:
+    """Write the [[dotbots]] entry of the robot at the 1-based index to f."""
+    # Manually build the TOML entry string to preserve underscores
+    f.write(
+        f"[[dotbots]]\n"
+        f'address = "{dotbot_address(index)}"\n'
+        f"calibrated = 0xff\n"
+        f"pos_x = {pos_x:_}\n"
+        f"pos_y = {pos_y:_}\n"
+        f"direction = {direction}\n"
+    )
+    if control_loop_library_path is not None:
+        f.write(f'custom_control_loop_library = "{control_loop_library_path}"\n')
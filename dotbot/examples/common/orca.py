@@ -12,7 +12,6 @@ from dotbot.examples.common.vec2 import (
     length_sq,
     mul,
     normalize,
-    perp,
     sub,
     vec,
     vec2_length,
@@ -21,7 +20,7 @@ from dotbot.examples.common.vec2 import (
 # ========= ORCA LINE =========
 
 
-@dataclass
+@dataclass(slots=True)
 class OrcaLine:
     point: Vec2
     direction: Vec2
@@ -31,7 +30,7 @@ class OrcaLine:
 # ========= AGENT =========
 
 
-@dataclass
+@dataclass(slots=True)
 class Agent:
     id: str
     position: Vec2
@@ -41,7 +40,7 @@ class Agent:
     preferred_velocity: Vec2
 
 
-@dataclass
+@dataclass(slots=True)
 class OrcaParams:
     time_horizon: float
     time_step: float
@@ -62,79 +61,90 @@ def compute_orca_lines_for_agent(
     return lines
 
 
-def compute_orca_line_pair(A: Agent, B: Agent, params: OrcaParams) -> OrcaLine:
+def _normalized(x: float, y: float) -> tuple[float, float]:
+    length = math.sqrt(x * x + y * y)
+    if length == 0:
+        return 0.0, 0.0
+    return x / length, y / length
+
 
+def compute_orca_line_pair(A: Agent, B: Agent, params: OrcaParams) -> OrcaLine:
+    # Evaluated once per neighbor pair per tick: work on plain floats and only
+    # build Vec2 objects for the resulting line.
     time_horizon = params.time_horizon
 
-    rel_pos = sub(B.position, A.position)
-    rel_vel = sub(A.velocity, B.velocity)
-    dist_sq = length_sq(rel_pos)
+    rel_pos_x = B.position.x - A.position.x
+    rel_pos_y = B.position.y - A.position.y
+    rel_vel_x = A.velocity.x - B.velocity.x
+    rel_vel_y = A.velocity.y - B.velocity.y
+    dist_sq = rel_pos_x * rel_pos_x + rel_pos_y * rel_pos_y
     combined_radius = A.radius + B.radius
     combined_radius_sq = combined_radius * combined_radius
 
-    line = OrcaLine(point=vec(0, 0), direction=vec(0, 0), normal=vec(0, 0))
-
     # CASE 1: No collision yet
     if dist_sq > combined_radius_sq:
         inv_th = 1.0 / time_horizon
-        w = sub(rel_vel, mul(rel_pos, inv_th))
-        w_len_sq = length_sq(w)
-        dot_w_rel = dot(w, rel_pos)
+        w_x = rel_vel_x - rel_pos_x * inv_th
+        w_y = rel_vel_y - rel_pos_y * inv_th
+        w_len_sq = w_x * w_x + w_y * w_y
+        dot_w_rel = w_x * rel_pos_x + w_y * rel_pos_y
 
         # Circle projection condition
         if dot_w_rel < 0 and dot_w_rel * dot_w_rel > combined_radius_sq * w_len_sq:
             w_len = math.sqrt(w_len_sq)
-            unit_w = mul(w, 1.0 / w_len)
-            u = mul(unit_w, combined_radius * inv_th - w_len)
+            normal_x = w_x / w_len
+            normal_y = w_y / w_len
+            u_len = combined_radius * inv_th - w_len
+            u_x = normal_x * u_len
+            u_y = normal_y * u_len
 
-            line.point = add(A.velocity, mul(u, 0.5))
-            line.normal = unit_w
-            line.direction = perp(line.normal)
+            direction_x, direction_y = -normal_y, normal_x
 
         else:
             leg = math.sqrt(dist_sq - combined_radius_sq)
 
-            left_leg = Vec2(
-                (rel_pos.x * leg - rel_pos.y * combined_radius) / dist_sq,
-                (rel_pos.x * combined_radius + rel_pos.y * leg) / dist_sq,
-            )
-
-            right_leg = Vec2(
-                (rel_pos.x * leg + rel_pos.y * combined_radius) / dist_sq,
-                (-rel_pos.x * combined_radius + rel_pos.y * leg) / dist_sq,
-            )
-
-            side = cross(rel_pos, w)
+            side = rel_pos_x * w_y - rel_pos_y * w_x
 
             if side > 0:
-                leg_dir = left_leg
+                # Left leg
+                direction_x = (rel_pos_x * leg - rel_pos_y * combined_radius) / dist_sq
+                direction_y = (rel_pos_x * combined_radius + rel_pos_y * leg) / dist_sq
             else:
-                leg_dir = right_leg
+                # Right leg
+                direction_x = (rel_pos_x * leg + rel_pos_y * combined_radius) / dist_sq
+                direction_y = (-rel_pos_x * combined_radius + rel_pos_y * leg) / dist_sq
 
-            proj = dot(rel_vel, leg_dir)
-            closest_point = mul(leg_dir, proj)
-            u = sub(closest_point, rel_vel)
+            proj = rel_vel_x * direction_x + rel_vel_y * direction_y
+            u_x = direction_x * proj - rel_vel_x
+            u_y = direction_y * proj - rel_vel_y
 
-            line.point = add(A.velocity, mul(u, 0.5))
-            line.direction = leg_dir
-            line.normal = normalize(perp(line.direction))
+            normal_x, normal_y = _normalized(-direction_y, direction_x)
 
     else:
         # CASE 2: Already colliding
         inv_dt = 0.5 / params.time_step
-        w = sub(rel_vel, mul(rel_pos, inv_dt))
-        w_len = vec2_length(w)
-        unit_w = mul(w, 1.0 / w_len) if w_len > 0 else vec(1, 0)
+        w_x = rel_vel_x - rel_pos_x * inv_dt
+        w_y = rel_vel_y - rel_pos_y * inv_dt
+        w_len = math.sqrt(w_x * w_x + w_y * w_y)
+        if w_len > 0:
+            normal_x = w_x / w_len
+            normal_y = w_y / w_len
+        else:
+            normal_x, normal_y = 1.0, 0.0
 
-        u = mul(unit_w, combined_radius * inv_dt - w_len)
+        u_len = combined_radius * inv_dt - w_len
+        u_x = normal_x * u_len
+        u_y = normal_y * u_len
 
-        line.point = add(A.velocity, mul(u, 0.5))
-        line.normal = unit_w
-        line.direction = perp(unit_w)
+        direction_x, direction_y = -normal_y, normal_x
 
-    line.direction = normalize(line.direction)
-    line.normal = normalize(line.normal)
-    return line
+    direction_x, direction_y = _normalized(direction_x, direction_y)
+    normal_x, normal_y = _normalized(normal_x, normal_y)
+    return OrcaLine(
+        point=Vec2(A.velocity.x + u_x * 0.5, A.velocity.y + u_y * 0.5),
+        direction=Vec2(direction_x, direction_y),
+        normal=Vec2(normal_x, normal_y),
+    )
 
 
 def is_feasible(line: OrcaLine, v: Vec2) -> bool:
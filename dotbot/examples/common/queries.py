@@ -0,0 +1,8 @@
+"""REST queries shared by the example control loops."""
+
+from dotbot.models import DotBotQueryModel, DotBotStatus
+
+# Control loops only need the latest pose of each bot: skip the position
+# history so each poll doesn't serialize and re-validate up to
+# MAX_POSITION_HISTORY_SIZE entries per bot.
+ACTIVE_DOTBOTS_QUERY = DotBotQueryModel(status=DotBotStatus.ACTIVE, max_positions=0)
@@ -12,7 +12,7 @@ import math
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Vec2:
     x: float
     y: float
@@ -3,6 +3,8 @@ import random
 import click
 from rich import print
 
+from dotbot.examples.common.init_state import write_dotbot_entry
+
 # --- Configuration ---
 WIDTH_NODES_DEFAULT = 5  # Robots per row
 HEIGHT_NODES_DEFAULT = 5  # Number of rows
@@ -12,7 +14,8 @@ SEP_X_DEFAULT = 240  # Separation between columns
 SEP_Y_DEFAULT = 240  # Separation between rows
 
 
-def generate_lattice_toml(
+def write_lattice_toml(
+    f,
     width_count,
     height_count,
     start_x,
@@ -22,35 +25,29 @@ def generate_lattice_toml(
     direction=None,
     control_loop_library_path=None,
 ):
-    output_lines = []
-
-    for row in range(height_count):
-        for col in range(width_count):
-            bot_id = row * width_count + col + 1
-            address = f"AAAAAAAA{bot_id:08X}"
-
-            # Calculate positions
-            pos_x = start_x + (col * sep_x)
-            pos_y = start_y + (row * sep_y)
+    """Write the lattice entries to the open text file f, one block per bot."""
+    # Randomize direction between 0 and 360, drawn once for the whole lattice
+    if direction is None:
+        direction = random.randint(0, 360)
 
-            # Randomize direction between 0 and 360
-            if direction is None:
-                direction = random.randint(0, 360)
+    # Coordinates only depend on the column or the row: compute them once
+    columns_x = [start_x + (col * sep_x) for col in range(width_count)]
+    rows_y = [start_y + (row * sep_y) for row in range(height_count)]
 
-            # Manually build the TOML entry string to preserve underscores
-            output_lines.append("[[dotbots]]")
-            output_lines.append(f'address = "{address}"')
-            output_lines.append("calibrated = 0xff")
-            output_lines.append(f"pos_x = {pos_x:_}")
-            output_lines.append(f"pos_y = {pos_y:_}")
-            output_lines.append(f"direction = {direction}")
-            if control_loop_library_path is not None:
-                output_lines.append(
-                    f'custom_control_loop_library = "{control_loop_library_path}"'
-                )
-            output_lines.append("")  # Empty line for readability
-
-    return "\n".join(output_lines)
+    for row, pos_y in enumerate(rows_y):
+        for col, pos_x in enumerate(columns_x):
+            bot_id = row * width_count + col + 1
+            # Empty line between entries for readability
+            if bot_id > 1:
+                f.write("\n")
+            write_dotbot_entry(
+                f,
+                bot_id,
+                pos_x=pos_x,
+                pos_y=pos_y,
+                direction=direction,
+                control_loop_library_path=control_loop_library_path,
+            )
 
 
 @click.command()
@@ -122,20 +119,19 @@ def main(
     print(f"  - Start coordinate (X,Y)  : {start_x}, {start_y}")
     print(f"  - Separation (X,Y)        : {sep_x}, {sep_y}\n")
 
-    toml_string = generate_lattice_toml(
-        width,
-        height,
-        start_x,
-        start_y,
-        sep_x,
-        sep_y,
-        direction,
-        control_loop_library_path,
-    )
-
     # Save to file
     with open(output_path, "w") as f:
-        f.write(toml_string)
+        write_lattice_toml(
+            f,
+            width,
+            height,
+            start_x,
+            start_y,
+            sep_x,
+            sep_y,
+            direction,
+            control_loop_library_path,
+        )
 
     print(f"Generated TOML file at {output_path}")
 
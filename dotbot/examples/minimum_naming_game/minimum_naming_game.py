@@ -69,11 +69,7 @@ async def main() -> None:
         ws = DotBotWsClient(url, port)
         await ws.connect()
         try:
-
-            counter = 0
-
             while True:
-                print("Step", counter)
 
                 for dotbot in dotbots:
 
@@ -147,7 +143,6 @@ async def main() -> None:
                     )
 
                 # await asyncio.sleep(0.1)
-                counter += 1
         finally:
             await ws.close()
 
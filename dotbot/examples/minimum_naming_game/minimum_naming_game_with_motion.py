@@ -6,13 +6,12 @@ from typing import List
 import numpy as np
 from scipy.spatial import cKDTree
 
+from dotbot.examples.common.queries import ACTIVE_DOTBOTS_QUERY
 from dotbot.examples.minimum_naming_game.controller_with_motion import Controller
 from dotbot.models import (
     DotBotLH2Position,
     DotBotModel,
-    DotBotQueryModel,
     DotBotRgbLedCommandModel,
-    DotBotStatus,
     DotBotWaypoints,
     WSRgbLed,
     WSWaypoints,
@@ -23,6 +22,7 @@ from dotbot.websocket import DotBotWsClient
 
 COMM_RANGE = 250
 THRESHOLD = 0
+DT = 0.1  # Control loop period (seconds)
 
 # TODO: Measure these values for real dotbots
 BOT_RADIUS = 60  # Physical radius of a DotBot (unit), used for collision avoidance
@@ -35,9 +35,7 @@ dotbot_controllers = dict()
 
 
 async def fetch_active_dotbots(client: RestClient) -> List[DotBotModel]:
-    return await client.fetch_dotbots(
-        query=DotBotQueryModel(status=DotBotStatus.ACTIVE)
-    )
+    return await client.fetch_dotbots(query=ACTIVE_DOTBOTS_QUERY)
 
 
 async def main() -> None:
@@ -79,11 +77,7 @@ async def main() -> None:
         ws = DotBotWsClient(url, port)
         await ws.connect()
         try:
-
-            counter = 0
-
             while True:
-                print("Step", counter)
 
                 dotbots = await fetch_active_dotbots(client)
 
@@ -101,6 +95,7 @@ async def main() -> None:
                 # This tree can now be used for fast spatial queries (like finding neighbors)
                 tree = cKDTree(positions)
 
+                messages = []
                 for dotbot in dotbots:
 
                     controller = dotbot_controllers[dotbot.address]
@@ -169,13 +164,15 @@ async def main() -> None:
                         ],
                     )
 
-                    await client.send_waypoint_command(
-                        address=dotbot.address,
-                        application=ApplicationType.DotBot,
-                        command=waypoints,
+                    messages.append(
+                        WSWaypoints(
+                            cmd="waypoints",
+                            address=dotbot.address,
+                            application=ApplicationType.DotBot,
+                            data=waypoints,
+                        )
                     )
-
-                    await ws.send(
+                    messages.append(
                         WSRgbLed(
                             cmd="rgb_led",
                             address=dotbot.address,
@@ -188,13 +185,15 @@ async def main() -> None:
                         )
                     )
 
-                # await asyncio.sleep(0.1)
-                counter += 1
+                # Send all waypoint and LED commands of the tick in one frame
+                await ws.send_many(messages)
+
+                await asyncio.sleep(DT)
         except (asyncio.CancelledError, KeyboardInterrupt):
             # stop all dotbots
             active_dotbots = await fetch_active_dotbots(client)
-            for dotbot in active_dotbots:
-                await ws.send(
+            await ws.send_many(
+                [
                     WSWaypoints(
                         cmd="waypoints",
                         address=dotbot.address,
@@ -204,7 +203,9 @@ async def main() -> None:
                             waypoints=[],
                         ),
                     )
-                )
+                    for dotbot in active_dotbots
+                ]
+            )
         finally:
             await ws.close()
 
@@ -259,9 +259,11 @@ def circle_waypoints(scale: float, arena_size: int, n_points: int) -> list[dict]
     """Approximate a circle with n_points waypoints centered in the arena."""
     cx, cy = _center(arena_size)
     r = scale / 2
+    # Step along the circle by a fixed angle; the last point closes the loop.
+    dtheta = 2 * math.pi / n_points
     points = []
     for i in range(n_points + 1):
-        angle = math.radians(i * 360 / n_points)
+        angle = i * dtheta
         points.append(
             {
                 "x": round(cx + r * math.cos(angle)),
@@ -338,12 +340,14 @@ def infinity_waypoints(scale: float, arena_size: int, n_points: int) -> list[dic
     """
     cx, cy = _center(arena_size)
     a = scale / 2  # scale is the total width of the shape
+    dt = 2 * math.pi / n_points
     points = []
     for i in range(n_points + 1):
-        t = math.radians(i * 360 / n_points)
-        denom = 1 + math.sin(t) ** 2
-        x = a * math.cos(t) / denom
-        y = a * math.sin(t) * math.cos(t) / denom
+        t = i * dt
+        sin_t, cos_t = math.sin(t), math.cos(t)
+        denom = 1 + sin_t * sin_t
+        x = a * cos_t / denom
+        y = a * sin_t * cos_t / denom
         points.append({"x": round(cx + x), "y": round(cy + y)})
     return points
 
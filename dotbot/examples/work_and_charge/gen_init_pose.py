@@ -1,5 +1,7 @@
 import click
 
+from dotbot.examples.common.init_state import write_dotbot_entry
+
 # Configuration Constants
 NUM_ROBOTS = 8  # Total robots to generate
 START_ID = 1  # Start at AAAAAAAA00000001
@@ -23,38 +25,22 @@ DIRECTION = 180
 )
 def main(output_path, control_loop_library_path):
 
-    lines = []
-
-    for i in range(NUM_ROBOTS):
-        # 1. Address: Increments by 1 every robot
-        address_hex = f"AAAAAAAA{START_ID + i:08X}"
-
-        # 2. X Position: Alternates 800, 100, 800, 100...
-        pos_x_val = X_RIGHT if i % 2 == 0 else X_LEFT
-
-        # 3. Y Position: Increases by 200 for EVERY robot
-        pos_y_val = START_Y + (i * Y_STEP)
-
-        # 4. Format numbers with underscores (e.g., 800_000)
-        pos_x = f"{pos_x_val:,}".replace(",", "_")
-        pos_y = f"{pos_y_val:,}".replace(",", "_")
-
-        # Build the TOML block
-        block = (
-            f"[[dotbots]]\n"
-            f'address = "{address_hex}"\n'
-            f"calibrated = 0xff\n"
-            f"pos_x = {pos_x}\n"
-            f"pos_y = {pos_y}\n"
-            f"direction = {DIRECTION}\n"
-        )
-        if control_loop_library_path is not None:
-            block += f'custom_control_loop_library = "{control_loop_library_path}"\n'
-        lines.append(block)
-
-    # Save to file
+    # Save to file, one block per robot
     with open(output_path, "w") as f:
-        f.write("\n".join(lines))
+        for i in range(NUM_ROBOTS):
+            # Empty line between blocks
+            if i > 0:
+                f.write("\n")
+            write_dotbot_entry(
+                f,
+                START_ID + i,
+                # X Position: Alternates 800, 100, 800, 100...
+                pos_x=X_RIGHT if i % 2 == 0 else X_LEFT,
+                # Y Position: Increases by 200 for EVERY robot
+                pos_y=START_Y + (i * Y_STEP),
+                direction=DIRECTION,
+                control_loop_library_path=control_loop_library_path,
+            )
 
     print(f"Generated TOML file at {output_path}")
 
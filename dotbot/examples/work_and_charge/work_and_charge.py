@@ -11,14 +11,13 @@ from dotbot.examples.common.orca import (
     OrcaParams,
     compute_orca_velocity_for_agent,
 )
+from dotbot.examples.common.queries import ACTIVE_DOTBOTS_QUERY
 from dotbot.examples.common.vec2 import Vec2
 from dotbot.examples.work_and_charge.controller import THRESHOLD, Controller
 from dotbot.models import (
     DotBotLH2Position,
     DotBotModel,
-    DotBotQueryModel,
     DotBotRgbLedCommandModel,
-    DotBotStatus,
     DotBotWaypoints,
     WSRgbLed,
     WSWaypoints,
@@ -31,6 +30,11 @@ ORCA_RANGE = 200
 
 DT = 0.2  # Control loop period (seconds)
 
+BIAS_ANGLE = 0.0  # Right-hand rule bias applied to the angle to goal (radians)
+COS_BIAS = math.cos(BIAS_ANGLE)
+SIN_BIAS = math.sin(BIAS_ANGLE)
+STOP_DISTANCE_SQ = (THRESHOLD * 1.15 / 1000) ** 2
+
 # TODO: Measure these values for real dotbots
 BOT_RADIUS = 60  # Physical radius of a DotBot (unit), used for collision avoidance
 MAX_SPEED = 200  # Maximum allowed linear speed of a bot (mm/s)
@@ -50,9 +54,7 @@ dotbot_controllers = dict()
 
 
 async def fetch_active_dotbots(client: RestClient) -> List[DotBotModel]:
-    return await client.fetch_dotbots(
-        query=DotBotQueryModel(status=DotBotStatus.ACTIVE)
-    )
+    return await client.fetch_dotbots(query=ACTIVE_DOTBOTS_QUERY)
 
 
 def order_bots(
@@ -90,37 +92,18 @@ def preferred_vel(dotbot: DotBotModel, goal: Vec2 | None) -> Vec2:
 
     dx = goal["x"] - dotbot.lh2_position.x
     dy = goal["y"] - dotbot.lh2_position.y
-    dist = math.sqrt(dx * dx + dy * dy)
 
-    dist1000 = dist * 1000
     # If close to goal, stop
-    if dist1000 < THRESHOLD * 1.15:
+    if dx * dx + dy * dy < STOP_DISTANCE_SQ:
         return Vec2(x=0, y=0)
 
-    # Right-hand rule bias
-    bias_angle = 0.0
-
-    # Convert bot direction into radians
-    direction = direction_to_rad(dotbot.direction)
-
-    # Angle to goal
-    angle_to_goal = math.atan2(dy, dx) + bias_angle
-
-    delta = angle_to_goal - direction
-    # Wrap to [-π, +π]
-    delta = math.atan2(math.sin(delta), math.cos(delta))
-
-    # Final allowed direction
-    final_angle = direction + delta
-    result = Vec2(
-        x=math.cos(final_angle) * MAX_SPEED, y=math.sin(final_angle) * MAX_SPEED
-    )
-    return result
-
-
-def direction_to_rad(direction: float) -> float:
-    rad = (direction + 90) * math.pi / 180.0
-    return math.atan2(math.sin(rad), math.cos(rad))  # normalize to [-π, π]
+    # The heading delta is wrapped but never clamped, so the final direction is
+    # always the (biased) angle to goal: scale the unit vector towards the goal
+    # and rotate it by the precomputed bias instead of going through atan2/sin/cos.
+    scale = MAX_SPEED / math.sqrt(dx * dx + dy * dy)
+    ux = dx * scale
+    uy = dy * scale
+    return Vec2(x=ux * COS_BIAS - uy * SIN_BIAS, y=ux * SIN_BIAS + uy * COS_BIAS)
 
 
 async def compute_orca_velocity(
@@ -149,11 +132,16 @@ async def main() -> None:
             controller = Controller(dotbot.address, sct_path)
             dotbot_controllers[dotbot.address] = controller
 
-            # Cosmetic: all bots are red
-            await client.send_rgb_led_command(
-                address=dotbot.address,
-                command=DotBotRgbLedCommandModel(red=255, green=0, blue=0),
-            )
+        # Cosmetic: all bots are red
+        await asyncio.gather(
+            *[
+                client.send_rgb_led_command(
+                    address=dotbot.address,
+                    command=DotBotRgbLedCommandModel(red=255, green=0, blue=0),
+                )
+                for dotbot in dotbots
+            ]
+        )
 
         # Set work and charge goals for each robot
         # sorted_bots = order_bots(dotbots, QUEUE_HEAD_X, QUEUE_HEAD_Y)
@@ -221,6 +209,7 @@ async def main() -> None:
                     tree = cKDTree(positions)
 
                     # Run controller for each robot
+                    messages = []
                     for dotbot in dotbots:
                         agent = agents[dotbot.address]
                         pos = dotbot.lh2_position
@@ -268,11 +257,12 @@ async def main() -> None:
                         if goal is not None:
                             dx = goal["x"] - agent.position.x
                             dy = goal["y"] - agent.position.y
-                            dist_to_goal = math.hypot(dx, dy)
+                            dist_to_goal_sq = dx * dx + dy * dy
 
-                            step_len = math.hypot(step.x, step.y)
-                            if step_len > dist_to_goal and step_len > 0:
-                                scale = dist_to_goal / step_len
+                            # Compare squared lengths; only take a root when clamping.
+                            step_len_sq = step.x * step.x + step.y * step.y
+                            if step_len_sq > dist_to_goal_sq:
+                                scale = math.sqrt(dist_to_goal_sq / step_len_sq)
                                 step = Vec2(x=step.x * scale, y=step.y * scale)
                         # ------------------------------------
 
@@ -295,7 +285,7 @@ async def main() -> None:
                                 )
                             ],
                         )
-                        await ws.send(
+                        messages.append(
                             WSWaypoints(
                                 cmd="waypoints",
                                 address=agent.id,
@@ -303,7 +293,7 @@ async def main() -> None:
                                 data=waypoints,
                             )
                         )
-                        await ws.send(
+                        messages.append(
                             WSRgbLed(
                                 cmd="rgb_led",
                                 address=agent.id,
@@ -315,12 +305,13 @@ async def main() -> None:
                                 ),
                             )
                         )
+                    await ws.send_many(messages)
 
                     await asyncio.sleep(DT)
             except (asyncio.CancelledError, KeyboardInterrupt):
                 active_dotbots = await fetch_active_dotbots(client)
-                for dotbot in active_dotbots:
-                    await ws.send(
+                await ws.send_many(
+                    [
                         WSWaypoints(
                             cmd="waypoints",
                             address=dotbot.address,
@@ -330,7 +321,9 @@ async def main() -> None:
                                 waypoints=[],
                             ),
                         )
-                    )
+                        for dotbot in active_dotbots
+                    ]
+                )
                 return
             except Exception as e:
                 print(f"Connection lost: {e}")
@@ -7,6 +7,7 @@
 
 import base64
 import os
+from contextlib import asynccontextmanager
 from typing import Annotated, List
 
 import httpx
@@ -59,33 +60,42 @@ PYDOTBOT_FRONTEND_BASE_URL = os.getenv(
 ws_adapter = TypeAdapter(WSMessage)
 
 
+PROXY_UPSTREAM_URL = "http://localhost:8080"
+
+
 class ReverseProxyMiddleware(BaseHTTPMiddleware):
 
     async def dispatch(self, request, call_next):
         if request.url.path.startswith("/pin"):
             headers = {k: v for k, v in request.headers.items()}
-            url = f"http://localhost:8080{request.url.path}"
-
-            async with httpx.AsyncClient() as client:
-                try:
-                    response = await client.get(
-                        url,
-                        headers=headers,
-                    )
-                except httpx.ConnectError as exc:
-                    LOGGER.warning(exc)
-                    return Response(status_code=502, content=b"Proxy connection failed")
-
-                return Response(
-                    content=response.content,
-                    status_code=response.status_code,
-                    headers=response.headers,
+            try:
+                response = await request.app.state.proxy_client.get(
+                    request.url.path,
+                    headers=headers,
                 )
+            except httpx.ConnectError as exc:
+                LOGGER.warning(exc)
+                return Response(status_code=502, content=b"Proxy connection failed")
+
+            return Response(
+                content=response.content,
+                status_code=response.status_code,
+                headers=response.headers,
+            )
 
         response = await call_next(request)
         return response
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # A single client for all proxied requests keeps the upstream connection
+    # alive instead of setting up a new connection pool for each request.
+    async with httpx.AsyncClient(base_url=PROXY_UPSTREAM_URL) as proxy_client:
+        app.state.proxy_client = proxy_client
+        yield
+
+
 api = FastAPI(
     debug=0,
     title="DotBot controller API",
@@ -93,6 +103,7 @@ api = FastAPI(
     version=pydotbot_version(),
     docs_url="/api",
     redoc_url=None,
+    lifespan=lifespan,
 )
 api.add_middleware(
     CORSMiddleware,
@@ -181,15 +192,15 @@ async def _dotbots_waypoints(
     application: int,
     waypoints: DotBotWaypoints,
 ):
+    dotbot = api.controller.dotbots[address]
+    waypoints_count = len(waypoints.waypoints)
     waypoints_list = waypoints.waypoints
     if application == ApplicationType.SailBot.value:
-        if api.controller.dotbots[address].gps_position is not None:
-            waypoints_list = [
-                api.controller.dotbots[address].gps_position
-            ] + waypoints.waypoints
+        if dotbot.gps_position is not None:
+            waypoints_list = [dotbot.gps_position] + waypoints.waypoints
         payload = PayloadGPSWaypoints(
             threshold=waypoints.threshold,
-            count=len(waypoints.waypoints),
+            count=waypoints_count,
             waypoints=[
                 PayloadGPSPosition(
                     latitude=int(waypoint.latitude * 1e6),
@@ -204,18 +215,13 @@ async def _dotbots_waypoints(
             waypoints_threshold=waypoints.threshold,
         )
     else:  # DotBot application
-        if api.controller.dotbots[address].lh2_position is not None:
-            waypoints_list = [
-                api.controller.dotbots[address].lh2_position
-            ] + waypoints.waypoints
+        if dotbot.lh2_position is not None:
+            waypoints_list = [dotbot.lh2_position] + waypoints.waypoints
         payload = PayloadLH2Waypoints(
             threshold=waypoints.threshold,
-            count=len(waypoints.waypoints),
+            count=waypoints_count,
             waypoints=[
-                PayloadLH2Location(
-                    pos_x=int(waypoint.x),
-                    pos_y=int(waypoint.y),
-                )
+                PayloadLH2Location(pos_x=int(waypoint.x), pos_y=int(waypoint.y))
                 for waypoint in waypoints.waypoints
             ],
         )
@@ -224,8 +230,8 @@ async def _dotbots_waypoints(
             lh2_waypoints=waypoints_list,
             waypoints_threshold=waypoints.threshold,
         )
-    api.controller.dotbots[address].waypoints = waypoints_list
-    api.controller.dotbots[address].waypoints_threshold = waypoints.threshold
+    dotbot.waypoints = waypoints_list
+    dotbot.waypoints_threshold = waypoints.threshold
     api.controller.send_payload(int(address, 16), payload)
     notification = DotBotNotificationModel(
         cmd=DotBotNotificationCommand.UPDATE, data=update_data
@@ -262,9 +268,10 @@ async def dotbot(address: str, max_positions: int = MAX_POSITION_HISTORY_SIZE):
     """Dotbot HTTP GET handler."""
     if address not in api.controller.dotbots:
         raise HTTPException(status_code=404, detail="No matching dotbot found")
-    _dotbot = DotBotModel(**api.controller.dotbots[address].model_dump())
-    _dotbot.position_history = _dotbot.position_history[:max_positions]
-    return _dotbot
+    _dotbot = api.controller.dotbots[address]
+    return _dotbot.model_copy(
+        update={"position_history": _dotbot.position_history[:max_positions]}
+    )
 
 
 @api.get(
@@ -319,44 +326,49 @@ async def websocket_endpoint(websocket: WebSocket):
             api.controller.websockets.remove(websocket)
 
 
+async def _ws_dotbots_handle_message(websocket: WebSocket, raw):
+    try:
+        msg = ws_adapter.validate_python(raw)
+    except ValidationError as e:
+        await websocket.send_json(
+            {
+                "error": "invalid_message",
+                "details": e.errors(),
+            }
+        )
+        return
+
+    if msg.address not in api.controller.dotbots:
+        # ignore messages where address doesn't exist
+        return
+
+    if isinstance(msg, WSRgbLed):
+        await _dotbots_rgb_led(
+            address=msg.address,
+            command=msg.data,
+        )
+    elif isinstance(msg, WSMoveRaw):
+        _dotbots_move_raw(
+            address=msg.address,
+            command=msg.data,
+        )
+    elif isinstance(msg, WSWaypoints):
+        await _dotbots_waypoints(
+            address=msg.address,
+            application=msg.application,
+            waypoints=msg.data,
+        )
+
+
 @api.websocket("/controller/ws/dotbots")
 async def ws_dotbots(websocket: WebSocket):
     await websocket.accept()
     try:
         while True:
             raw = await websocket.receive_json()
-
-            try:
-                msg = ws_adapter.validate_python(raw)
-            except ValidationError as e:
-                await websocket.send_json(
-                    {
-                        "error": "invalid_message",
-                        "details": e.errors(),
-                    }
-                )
-                continue
-
-            if msg.address not in api.controller.dotbots:
-                # ignore messages where address doesn't exist
-                continue
-
-            if isinstance(msg, WSRgbLed):
-                await _dotbots_rgb_led(
-                    address=msg.address,
-                    command=msg.data,
-                )
-            elif isinstance(msg, WSMoveRaw):
-                _dotbots_move_raw(
-                    address=msg.address,
-                    command=msg.data,
-                )
-            elif isinstance(msg, WSWaypoints):
-                await _dotbots_waypoints(
-                    address=msg.address,
-                    application=msg.application,
-                    waypoints=msg.data,
-                )
+            # A frame holds either a single message or a batch of messages
+            for message in raw if isinstance(raw, list) else [raw]:
+                await _ws_dotbots_handle_message(websocket, message)
 
     except WebSocketDisconnect:
         LOGGER.debug("WebSocket client disconnected")
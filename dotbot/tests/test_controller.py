@@ -2,7 +2,7 @@
 
 import asyncio
 import time
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from dotbot_utils.hdlc import hdlc_encode
@@ -15,6 +15,8 @@ from dotbot.models import (
     DotBotGPSPosition,
     DotBotLH2Position,
     DotBotModel,
+    DotBotNotificationCommand,
+    DotBotNotificationModel,
     DotBotQueryModel,
     DotBotStatus,
 )
@@ -194,6 +196,18 @@ async def test_controller_get_dotbots_query(query, length, controller):
     assert len(dotbots) == length
 
 
+@pytest.mark.asyncio
+async def test_controller_notify_clients(controller):
+    """Check all websocket clients receive the same notification."""
+    websockets = [AsyncMock(), AsyncMock()]
+    controller.websockets = list(websockets)
+    await controller.notify_clients(
+        DotBotNotificationModel(cmd=DotBotNotificationCommand.RELOAD)
+    )
+    for websocket in websockets:
+        websocket.send_text.assert_awaited_once_with('{"cmd": 1}')
+
+
 @pytest.mark.filterwarnings("ignore::DeprecationWarning")
 def test_controller_sailbot_simulator():
     """Check controller called for sailbot simulator."""
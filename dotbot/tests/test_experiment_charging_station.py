@@ -182,6 +182,10 @@ class FakeDotBotWsClient:
         else:
             raise ValueError(f"Unknown WS command: {msg.cmd}")
 
+    async def send_many(self, msgs: list[WSMessage]):
+        for msg in msgs:
+            await self.send(msg)
+
 
 def fake_bot(address: str, x: float, y: float) -> DotBotModel:
     return DotBotModel(
@@ -27,6 +27,7 @@ from dotbot.protocol import (
     PayloadLH2Waypoints,
 )
 from dotbot.server import api
+from dotbot.websocket import ws_messages_adapter
 
 client = AsyncClient(transport=ASGITransport(app=api), base_url="http://testserver")
 
@@ -571,8 +572,8 @@ async def test_reverse_proxy_middleware_redirects_to_upstream(monkeypatch):
 
     monkeypatch.setattr(server_module.httpx, "AsyncClient", mock_async_client)
 
-    client = TestClient(api)
-    response = client.get("/pin/test")
+    with TestClient(api) as client:
+        response = client.get("/pin/test")
 
     assert response.status_code == 200
     assert response.content == b"proxied-content"
@@ -597,13 +598,39 @@ async def test_reverse_proxy_middleware_connect_error(monkeypatch):
     monkeypatch = pytest.MonkeyPatch()
     monkeypatch.setattr(server_module.httpx, "AsyncClient", mock_async_client)
 
-    client = TestClient(api)
-    response = client.get("/pin/fail")
+    with TestClient(api) as client:
+        response = client.get("/pin/fail")
 
     assert response.status_code == 502
     assert b"Proxy connection failed" in response.content
 
 
+def test_reverse_proxy_client_reused(monkeypatch):
+    async def mock_send(request: httpx.Request):
+        return httpx.Response(status_code=200)
+
+    transport = httpx.MockTransport(mock_send)
+    RealAsyncClient = httpx.AsyncClient
+    created_clients = []
+
+    def mock_async_client(*args, **kwargs):
+        kwargs.pop("transport", None)
+        created_clients.append(RealAsyncClient(transport=transport, **kwargs))
+        return created_clients[-1]
+
+    import dotbot.server as server_module
+
+    monkeypatch.setattr(server_module.httpx, "AsyncClient", mock_async_client)
+
+    with TestClient(api) as client:
+        client.get("/pin/first")
+        client.get("/pin/second")
+
+    assert len(created_clients) == 1
+    assert created_clients[0].base_url == httpx.URL(server_module.PROXY_UPSTREAM_URL)
+    assert created_clients[0].is_closed
+
+
 # @pytest.mark.asyncio
 # @patch("uvicorn.Server.serve")
 # async def test_web(serve, caplog):
@@ -771,3 +798,42 @@ def test_ws_invalid_message_validation_error():
     assert isinstance(response["details"], list)
 
     api.controller.send_payload.assert_not_called()
+
+
+def test_ws_dotbots_commands_batch():
+    api.controller.dotbots = {
+        "4242": DotBotModel(
+            address="4242",
+            application=ApplicationType.DotBot,
+            swarm="0000",
+            last_seen=123.4,
+        )
+    }
+    messages = [
+        WSRgbLed(
+            cmd="rgb_led",
+            address="4242",
+            application=ApplicationType.DotBot,
+            data=DotBotRgbLedCommandModel(red=255, green=0, blue=128),
+        ),
+        WSMoveRaw(
+            cmd="move_raw",
+            address="4242",
+            application=ApplicationType.DotBot,
+            data=DotBotMoveRawCommandModel(
+                left_x=0, left_y=100, right_x=0, right_y=100
+            ),
+        ),
+    ]
+
+    with TestClient(api).websocket_connect("/controller/ws/dotbots") as ws:
+        ws.send_text(ws_messages_adapter.dump_json(messages).decode())
+
+    assert api.controller.send_payload.call_count == 2
+    api.controller.send_payload.assert_any_call(
+        0x4242, PayloadCommandRgbLed(red=255, green=0, blue=128)
+    )
+    api.controller.send_payload.assert_any_call(
+        0x4242,
+        PayloadCommandMoveRaw(left_x=0, left_y=100, right_x=0, right_y=100),
+    )
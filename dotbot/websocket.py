@@ -1,5 +1,11 @@
+from typing import List
+
+from pydantic import TypeAdapter
+
 from dotbot.models import WSMessage
 
+ws_messages_adapter = TypeAdapter(List[WSMessage])
+
 
 class DotBotWsClient:
     def __init__(self, host, port):
@@ -18,3 +24,11 @@ class DotBotWsClient:
         if not self.ws:
             raise RuntimeError("WebSocket not connected")
         await self.ws.send(msg.model_dump_json())
+
+    async def send_many(self, msgs: List[WSMessage]):
+        """Send several messages in a single websocket frame."""
+        if not self.ws:
+            raise RuntimeError("WebSocket not connected")
+        if not msgs:
+            return
+        await self.ws.send(ws_messages_adapter.dump_json(msgs).decode())